@@ -0,0 +1,91 @@
+"""
+Defines helpers shared by the modules that talk to AWS.
+
+boto3 clients are expensive to construct but safe to share between
+threads, so every backend obtains its clients from a single cache
+instead of building its own.
+
+Copyright (c) 2025 Zachary Young.
+All rights reserved.
+"""
+
+import functools
+import os
+import threading
+
+import boto3
+
+from aldera import config
+
+
+_session = None
+_client_cache = {}
+_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the boto3 session shared by all Aldera clients.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = boto3.session.Session()
+    return _session
+
+
+def get_credentials():
+    """
+    Return the credentials of the shared boto3 session, or None.
+    """
+    session = get_session()
+    with _lock:
+        # Resolving credentials updates the session, which is not
+        # thread-safe.
+        return session.get_credentials()
+
+
+def get_client(service, region):
+    """
+    Return a boto3 client for the given service and region.
+
+    Clients are created on first use and reused for the lifetime of
+    the process.
+    """
+    key = (service, region)
+    try:
+        return _client_cache[key]
+    except KeyError:
+        pass
+    session = get_session()
+    with _lock:
+        # boto3 sessions are not thread-safe, so clients are built
+        # while holding the lock.
+        client = _client_cache.get(key)
+        if client is None:
+            client = session.client(service, region_name=region)
+            _client_cache[key] = client
+    return client
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_region():
+    """
+    Determines AWS region in order of priority:
+    1. ALDERA AWS_REGION setting
+    2. AWS_REGION environment variable
+    3. AWS_DEFAULT_REGION environment variable
+    4. 'us-east-1'
+
+    The result is cached until the Aldera configuration changes.
+    """
+    return (
+        config.get('AWS_REGION')
+        or os.environ.get('AWS_REGION')
+        or os.environ.get('AWS_DEFAULT_REGION')
+        or 'us-east-1'
+    )
+
+
+config.on_change(_resolve_region.cache_clear)
@@ -5,16 +5,66 @@ Copyright (c) 2025 Zachary Young.
 All rights reserved.
 """
 
+from types import MappingProxyType
+
+# Flask config keys with this prefix are loaded into the registry by
+# the Flask extensions.
+PREFIX = 'ALDERA_'
+PLEN = len(PREFIX)
+
 _config = {}
+_frozen = False
+
+# Callables invoked after the registry is written, used by modules
+# that cache values derived from it.
+_listeners = []
+
+# get(key, default=None) is bound straight to the registry dict so hot
+# reads skip a Python-level call. set() and load_dict() update the dict
+# in place, so the binding never goes stale.
+get = _config.get
+
+# Read-only view of the registry.
+settings = MappingProxyType(_config)
 
 
 def set(**kwargs):
+    _check_writable()
     _config.update(kwargs)
+    _notify()
 
 
 def load_dict(dict_items):
+    _check_writable()
     _config.update(dict_items)
+    _notify()
+
+
+def freeze():
+    """
+    Make the registry read-only.
+
+    Call once all configuration has been loaded, e.g. after every
+    init_app() call. Later calls to set() or load_dict() raise
+    RuntimeError, so a value such as DEBUG cannot change mid-request.
+    """
+    global _frozen
+    _frozen = True
+
+
+def on_change(func):
+    """
+    Register func to be called whenever the registry is written.
+    """
+    _listeners.append(func)
+    return func
+
+
+def _check_writable():
+    if _frozen:
+        raise RuntimeError('Aldera configuration is frozen.')
 
 
-def get(key, default=None):
-    return _config.get(key, default)
+def _notify():
+    for func in _listeners:
+        func()
@@ -0,0 +1,127 @@
+"""
+Defines MIME helpers shared by the email backends.
+
+Copyright (c) 2025 Zachary Young.
+All rights reserved.
+"""
+
+import base64
+import hashlib
+import io
+import mmap
+import os
+import threading
+from email import encoders
+from email.mime.base import MIMEBase
+from pathlib import PurePath
+
+
+# Limits on the base64-encoded attachment payloads kept in memory.
+# Larger payloads are never cached, so big attachments cost no memory
+# once the message has been sent.
+_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_CACHE_MAX_ENTRY_BYTES = 2 * 1024 * 1024
+
+# In-memory attachments above this size encode to more than
+# _CACHE_MAX_ENTRY_BYTES (every 57 bytes become a 77-character line),
+# so they are not hashed at all.
+_CACHE_MAX_DATA_BYTES = _CACHE_MAX_ENTRY_BYTES * 57 // 77
+
+# Files are encoded in chunks that are a multiple of 57 bytes, the
+# amount base64.encodebytes() puts on each 76-character line.
+_CHUNK_SIZE = 57 * 1024
+
+_encoded_payloads = {}
+_cached_bytes = 0
+_lock = threading.Lock()
+
+
+def _cache_key(data):
+    if isinstance(data, PurePath):
+        stat = os.stat(data)
+        return (
+            PurePath, os.path.abspath(data), stat.st_mtime_ns, stat.st_size
+        )
+    if isinstance(data, str):
+        return (str, hashlib.blake2b(
+            data.encode('utf-8', 'surrogateescape'),
+            digest_size=16
+        ).digest())
+    return (bytes, hashlib.blake2b(data, digest_size=16).digest())
+
+
+def _encode_attachment(path):
+    """
+    Base64-encode the file at path without reading it into memory as
+    a single bytes object.
+    """
+    buf = io.BytesIO()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for start in range(0, size, _CHUNK_SIZE):
+                    buf.write(base64.encodebytes(
+                        data[start:start + _CHUNK_SIZE]
+                    ))
+    return buf.getvalue().decode('ascii')
+
+
+def _encode_data(data):
+    """
+    Base64-encode in-memory attachment content.
+    """
+    scratch = MIMEBase('application', 'octet-stream')
+    scratch.set_payload(data)
+    encoders.encode_base64(scratch)
+    return scratch.get_payload()
+
+
+def _store(key, payload):
+    """
+    Cache payload, evicting the oldest entries to stay within
+    _CACHE_MAX_BYTES.
+    """
+    global _cached_bytes
+    size = len(payload)
+    if size > _CACHE_MAX_ENTRY_BYTES:
+        return
+    with _lock:
+        if key in _encoded_payloads:
+            return
+        while _encoded_payloads and _cached_bytes + size > _CACHE_MAX_BYTES:
+            evicted = _encoded_payloads.pop(next(iter(_encoded_payloads)))
+            _cached_bytes -= len(evicted)
+        _encoded_payloads[key] = payload
+        _cached_bytes += size
+
+
+def attachment_part(filename, content_type, data):
+    """
+    Build a base64-encoded MIME part for an attachment.
+
+    data is either the attachment content or a path to a file, which
+    is encoded without loading it whole. Encoded payloads are cached by
+    content digest (or by path, mtime and size for files), so sending
+    the same small attachment repeatedly only encodes it once.
+    """
+    if isinstance(data, PurePath) or len(data) <= _CACHE_MAX_DATA_BYTES:
+        key = _cache_key(data)
+        payload = _encoded_payloads.get(key)
+    else:
+        key = payload = None
+    if payload is None:
+        if isinstance(data, PurePath):
+            payload = _encode_attachment(data)
+        else:
+            payload = _encode_data(data)
+        if key is not None:
+            _store(key, payload)
+    part = MIMEBase(*content_type.split('/'))
+    part.set_payload(payload)
+    part['Content-Transfer-Encoding'] = 'base64'
+    part.add_header(
+        'Content-Disposition',
+        f'attachment; filename="{filename}"'
+    )
+    return part
@@ -1,12 +1,49 @@
-import boto3
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from functools import cached_property, lru_cache
+
 from django.core.mail.backends.base import BaseEmailBackend
 from django.conf import settings
 from botocore.exceptions import ClientError
 import logging
 
+from aldera._aws import get_client
+from aldera.mail._mime import attachment_part
+from aldera.utils.ratelimit import BlockingTokenBucket, bucket_from_config
+
 
 logger = logging.getLogger(__name__)
 
+# SES accepts at most 50 entries per SendBulkEmail request.
+BULK_CHUNK_SIZE = 50
+
+
+@lru_cache(maxsize=None)
+def _get_bucket(rate, burst):
+    """
+    Return the rate limiter shared by backends with the same settings.
+
+    Django creates a backend per send, so the bucket cannot live on
+    the instance.
+    """
+    return BlockingTokenBucket(rate, burst)
+
+
+def _html_alternative(message):
+    """
+    Return the first text/html alternative of an EmailMessage, or None.
+    """
+    return next(
+        (
+            alt_content
+            for alt_content, alt_type in getattr(message, 'alternatives', ())
+            if alt_type == 'text/html'
+        ),
+        None
+    )
+
 
 class AWSEmailBackend(BaseEmailBackend):
     """
@@ -16,26 +53,36 @@ class AWSEmailBackend(BaseEmailBackend):
     def __init__(self, fail_silently=False, **kwargs):
         super().__init__(fail_silently=fail_silently, **kwargs)
         aldera_config = getattr(settings, 'ALDERA', {})
-        self.region_name = getattr(
-            aldera_config,
-            'AWS_REGION',
-            'us-east-1'
+        self.region_name = aldera_config.get('AWS_REGION', 'us-east-1')
+        self.configuration_set = aldera_config.get('CONFIGURATION_SET')
+        self.parallelism = aldera_config.get('SES_PARALLELISM', 16)
+        self.fast_path = aldera_config.get('SES_FAST_PATH', False)
+        self._bucket = bucket_from_config(
+            'SES', 14, 50, aldera_config, bucket_class=_get_bucket
         )
-        self.configuration_set = getattr(
-            aldera_config,
-            'CONFIGURATION_SET',
-            None
+        # Request parameters shared by every send.
+        self._base_params = (
+            {'ConfigurationSetName': self.configuration_set}
+            if self.configuration_set else {}
         )
-        self._client = None
 
-    @property
+    @cached_property
     def client(self):
         """
         Lazy initialization of boto3 SESv2 client.
         """
-        if self._client is None:
-            self._client = boto3.client('sesv2', region_name=self.region_name)
-        return self._client
+        return get_client('sesv2', self.region_name)
+
+    @cached_property
+    def _send_email(self):
+        """
+        The callable used to send single messages: FastSESClient when
+        SES_FAST_PATH is enabled, otherwise the boto3 client.
+        """
+        if self.fast_path:
+            from aldera.mail.backends.aws_fast import get_fast_client
+            return get_fast_client(self.region_name).send_email
+        return self.client.send_email
 
     def send_messages(self, email_messages):
         """
@@ -44,113 +91,232 @@ class AWSEmailBackend(BaseEmailBackend):
         if not email_messages:
             return 0
 
-        sent_count = 0
-        for message in email_messages:
-            if self._send(message):
-                sent_count += 1
+        groups = self._group_messages(email_messages)
+        if len(groups) == 1 or self.parallelism <= 1:
+            return sum(self._send_group(group) for group in groups)
 
-        return sent_count
+        # Sends are independent and bound by SES round-trip time, so run
+        # them concurrently. boto3 clients are thread-safe.
+        workers = min(self.parallelism, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(self._send_group, groups))
 
-    def _send(self, message):
+    def _send_group(self, group):
         """
-        Send a single EmailMessage.
+        Send a group from _group_messages and return the number sent.
         """
-        if not message.recipients():
-            return False
-
-        try:
-            # Build the email content
-            email_content = {
-                'Simple': {
-                    'Subject': {
-                        'Data': message.subject,
-                        'Charset': 'UTF-8'
-                    },
-                    'Body': {}
-                }
-            }
+        if len(group) > 1:
+            return self._send_bulk(group)
+        return 1 if self._send(group[0]) else 0
 
-            # Add body content
-            if message.content_subtype == 'html':
-                email_content['Simple']['Body']['Html'] = {
-                    'Data': message.body,
-                    'Charset': 'UTF-8'
-                }
-            else:
-                email_content['Simple']['Body']['Text'] = {
-                    'Data': message.body,
-                    'Charset': 'UTF-8'
-                }
+    def _bulk_key(self, message):
+        """
+        Return a key shared by messages that can be sent together with
+        SendBulkEmail, or None if the message must be sent on its own.
+        """
+        if message.attachments or not message.recipients():
+            return None
+
+        html = _html_alternative(message)
+
+        # Bulk content is sent as an SES template, so any literal
+        # '{{' would be treated as a template variable.
+        for text in (message.subject, message.body, html):
+            if text and '{{' in text:
+                return None
+
+        return (
+            message.subject,
+            message.body,
+            message.content_subtype,
+            message.from_email,
+            html,
+            tuple(message.reply_to),
+        )
 
-            # Handle multipart messages (text + html)
-            if hasattr(message, 'alternatives') and message.alternatives:
-                for alt_content, alt_type in message.alternatives:
-                    if alt_type == 'text/html':
-                        email_content['Simple']['Body']['Html'] = {
-                            'Data': alt_content,
-                            'Charset': 'UTF-8'
-                        }
+    def _group_messages(self, email_messages):
+        """
+        Group messages sharing the same content, preserving order.
+        """
+        groups = {}
+        for index, message in enumerate(email_messages):
+            key = self._bulk_key(message)
+            groups.setdefault(index if key is None else key, []).append(
+                message
+            )
+        return list(groups.values())
 
-            # Build destination
-            destination = {
-                'ToAddresses': message.to,
-            }
+    def _build_destination(self, message):
+        """
+        Build the SES Destination for a single EmailMessage.
+        """
+        destination = {'ToAddresses': message.to}
+        if message.cc:
+            destination['CcAddresses'] = message.cc
+        if message.bcc:
+            destination['BccAddresses'] = message.bcc
+        return destination
 
-            if message.cc:
-                destination['CcAddresses'] = message.cc
+    def _send_bulk(self, messages):
+        """
+        Send EmailMessages with identical content using SendBulkEmail.
 
-            if message.bcc:
-                destination['BccAddresses'] = message.bcc
+        Returns the number of messages accepted by SES.
+        """
+        first = messages[0]
+        template_content = {'Subject': first.subject}
+        if first.content_subtype == 'html':
+            template_content['Html'] = first.body
+        else:
+            template_content['Text'] = first.body
+        html_body = _html_alternative(first)
+        if html_body is not None:
+            template_content['Html'] = html_body
 
-            # Build the request parameters
+        sent_count = 0
+        for start in range(0, len(messages), BULK_CHUNK_SIZE):
+            chunk = messages[start:start + BULK_CHUNK_SIZE]
             params = {
-                'FromEmailAddress': message.from_email,
-                'Destination': destination,
-                'Content': email_content,
+                **self._base_params,
+                'FromEmailAddress': first.from_email,
+                'DefaultContent': {
+                    'Template': {
+                        'TemplateContent': template_content,
+                        'TemplateData': '{}',
+                    }
+                },
+                'BulkEmailEntries': [
+                    {'Destination': self._build_destination(message)}
+                    for message in chunk
+                ],
             }
 
-            # Add configuration set if specified
-            if self.configuration_set:
-                params['ConfigurationSetName'] = self.configuration_set
+            if first.reply_to:
+                params['ReplyToAddresses'] = first.reply_to
+
+            if self._bucket is not None:
+                self._bucket.acquire(len(chunk))
+
+            try:
+                response = self.client.send_bulk_email(**params)
+            except ClientError as e:
+                logger.error(
+                    "Failed to send email: %s",
+                    e.response['Error']['Message']
+                )
+                if not self.fail_silently:
+                    raise
+                continue
+            except Exception as e:
+                logger.error("Unexpected error sending email: %s", e)
+                if not self.fail_silently:
+                    raise
+                continue
+
+            failed = None
+            for result in response['BulkEmailEntryResults']:
+                if result['Status'] == 'SUCCESS':
+                    logger.info(
+                        "Email sent successfully. MessageId: %s",
+                        result['MessageId']
+                    )
+                    sent_count += 1
+                else:
+                    logger.error(
+                        "Failed to send email: %s", result.get('Error')
+                    )
+                    failed = failed or result
+
+            if failed is not None and not self.fail_silently:
+                raise ClientError(
+                    {
+                        'Error': {
+                            'Code': failed['Status'],
+                            'Message': failed.get('Error', ''),
+                        }
+                    },
+                    'SendBulkEmail'
+                )
 
-            # Add reply-to if specified
-            if message.reply_to:
-                params['ReplyToAddresses'] = message.reply_to
+        return sent_count
+
+    def _send(self, message):
+        """
+        Send a single EmailMessage.
+        """
+        if not message.recipients():
+            return False
+
+        try:
+            html_body = _html_alternative(message)
 
             # Handle attachments using Raw email if present
             if message.attachments:
-                params = self._build_raw_email(message)
+                params = self._build_raw_email(message, html_body)
+            else:
+                params = self._build_simple_email(message, html_body)
 
             # Send the email
-            response = self.client.send_email(**params)
-
-            logger.info(
-                f"Email sent successfully. MessageId: {response['MessageId']}"
-            )
+            if self._bucket is not None:
+                self._bucket.acquire()
+            response = self._send_email(**params)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Email sent successfully. MessageId: %s",
+                    response['MessageId']
+                )
             return True
 
         except ClientError as e:
             logger.error(
-                f"Failed to send email: {e.response['Error']['Message']}"
+                "Failed to send email: %s",
+                e.response['Error']['Message']
             )
             if not self.fail_silently:
                 raise
             return False
         except Exception as e:
-            logger.error(f"Unexpected error sending email: {str(e)}")
+            logger.error("Unexpected error sending email: %s", e)
             if not self.fail_silently:
                 raise
             return False
 
-    def _build_raw_email(self, message):
+    def _build_simple_email(self, message, html_body=None):
         """
-        Build raw email format for messages with attachments.
+        Build Simple content params for messages without attachments.
         """
-        from email.mime.multipart import MIMEMultipart
-        from email.mime.text import MIMEText
-        from email.mime.base import MIMEBase
-        from email import encoders
+        if message.content_subtype == 'html':
+            body = {'Html': {'Data': message.body, 'Charset': 'UTF-8'}}
+        else:
+            body = {'Text': {'Data': message.body, 'Charset': 'UTF-8'}}
+
+        # Handle multipart messages (text + html)
+        if html_body is not None:
+            body['Html'] = {'Data': html_body, 'Charset': 'UTF-8'}
+
+        params = {
+            **self._base_params,
+            'FromEmailAddress': message.from_email,
+            'Destination': self._build_destination(message),
+            'Content': {
+                'Simple': {
+                    'Subject': {'Data': message.subject, 'Charset': 'UTF-8'},
+                    'Body': body,
+                }
+            },
+        }
 
+        # Add reply-to if specified
+        if message.reply_to:
+            params['ReplyToAddresses'] = message.reply_to
+
+        return params
+
+    def _build_raw_email(self, message, html_body=None):
+        """
+        Build raw email format for messages with attachments.
+        """
         # Create message container
         msg = MIMEMultipart()
         msg['Subject'] = message.subject
@@ -170,10 +336,8 @@ class AWSEmailBackend(BaseEmailBackend):
             msg.attach(MIMEText(message.body, 'plain'))
 
         # Add HTML alternative if present
-        if hasattr(message, 'alternatives') and message.alternatives:
-            for alt_content, alt_type in message.alternatives:
-                if alt_type == 'text/html':
-                    msg.attach(MIMEText(alt_content, 'html'))
+        if html_body is not None:
+            msg.attach(MIMEText(html_body, 'html'))
 
         # Add attachments
         for attachment in message.attachments:
@@ -181,14 +345,7 @@ class AWSEmailBackend(BaseEmailBackend):
                 msg.attach(attachment)
             else:
                 filename, content, mimetype = attachment
-                part = MIMEBase(*mimetype.split('/'))
-                part.set_payload(content)
-                encoders.encode_base64(part)
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename="{filename}"'
-                )
-                msg.attach(part)
+                msg.attach(attachment_part(filename, mimetype, content))
 
         # Build destination
         destination = {'ToAddresses': message.to}
@@ -198,7 +355,8 @@ class AWSEmailBackend(BaseEmailBackend):
             destination['BccAddresses'] = message.bcc
 
         # Build params for raw email
-        params = {
+        return {
+            **self._base_params,
             'Content': {
                 'Raw': {
                     'Data': msg.as_bytes()
@@ -206,8 +364,3 @@ class AWSEmailBackend(BaseEmailBackend):
             },
             'Destination': destination,
         }
-
-        if self.configuration_set:
-            params['ConfigurationSetName'] = self.configuration_set
-
-        return params
@@ -0,0 +1,201 @@
+"""
+Defines a minimal SES v2 client that posts SigV4-signed requests over a
+pooled HTTPS connection, bypassing boto3's per-call request pipeline.
+
+Used by AWSEmailBackend when the SES_FAST_PATH setting is enabled.
+Payloads are serialized with orjson when it is installed. Throttled
+and 5xx responses are retried with backoff, as boto3 does.
+
+Copyright (c) 2025 Zachary Young.
+All rights reserved.
+"""
+
+import base64
+import json
+import random
+import threading
+import time
+
+import urllib3
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.exceptions import ClientError, NoCredentialsError
+
+from aldera._aws import get_credentials
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+
+SEND_EMAIL_PATH = '/v2/email/outbound-emails'
+
+# The connect and read timeouts boto3 uses by default.
+TIMEOUT = urllib3.Timeout(connect=60, read=60)
+
+# Attempts per request, matching botocore's standard retry mode.
+MAX_ATTEMPTS = 3
+RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+THROTTLING_CODES = frozenset((
+    'Throttling',
+    'ThrottlingException',
+    'TooManyRequestsException',
+))
+
+_clients = {}
+_lock = threading.Lock()
+
+
+def _dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(response):
+    """
+    Decode a JSON response body, or return None if it is not JSON.
+    """
+    if not response.data:
+        return {}
+    try:
+        return json.loads(response.data)
+    except ValueError:
+        return None
+
+
+def _error_code(response):
+    error_type = response.headers.get('x-amzn-ErrorType', '')
+    return error_type.split(':')[0] or str(response.status)
+
+
+def _backoff_delay(attempt):
+    """
+    Exponential backoff with equal jitter.
+    """
+    return 0.5 * (2 ** (attempt - 1)) * (0.5 + random.random())
+
+
+def get_fast_client(region):
+    """
+    Return the FastSESClient for the given region, shared process-wide.
+    """
+    try:
+        return _clients[region]
+    except KeyError:
+        pass
+    with _lock:
+        client = _clients.get(region)
+        if client is None:
+            client = FastSESClient(region)
+            _clients[region] = client
+    return client
+
+
+class FastSESClient:
+    """
+    Sends SES v2 SendEmail requests.
+
+    Only send_email is implemented. It accepts the same keyword
+    arguments as the boto3 sesv2 client, returns the decoded response
+    and raises botocore's ClientError on failure.
+    """
+
+    def __init__(self, region_name, maxsize=32):
+        self.region_name = region_name
+        self.host = f'email.{region_name}.amazonaws.com'
+        self.url = f'https://{self.host}{SEND_EMAIL_PATH}'
+        self._pool = urllib3.HTTPSConnectionPool(
+            self.host, maxsize=maxsize, timeout=TIMEOUT
+        )
+        credentials = get_credentials()
+        if credentials is None:
+            raise NoCredentialsError()
+        # Refreshable credentials renew themselves on access.
+        self._credentials = credentials
+
+    def _post(self, body):
+        """
+        Sign and send a SendEmail request body.
+
+        Each attempt is signed afresh, so retries carry a current
+        timestamp.
+        """
+        request = AWSRequest(
+            method='POST',
+            url=self.url,
+            data=body,
+            headers={'Content-Type': 'application/json'},
+        )
+        SigV4Auth(
+            self._credentials.get_frozen_credentials(),
+            'ses',
+            self.region_name
+        ).add_auth(request)
+        return self._pool.urlopen(
+            'POST',
+            SEND_EMAIL_PATH,
+            body=body,
+            headers=dict(request.headers.items()),
+        )
+
+    def send_email(self, **params):
+        """
+        Send an email and return the SES response.
+        """
+        content = params.get('Content', {})
+        if 'Raw' in content:
+            # Blobs are base64-encoded in the JSON protocol.
+            params = {
+                **params,
+                'Content': {
+                    'Raw': {
+                        'Data': base64.b64encode(
+                            content['Raw']['Data']
+                        ).decode('ascii')
+                    }
+                },
+            }
+        body = _dumps(params)
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            response = self._post(body)
+            if response.status < 300 or attempt == MAX_ATTEMPTS:
+                break
+            if (
+                response.status not in RETRYABLE_STATUSES
+                and _error_code(response) not in THROTTLING_CODES
+            ):
+                break
+            time.sleep(_backoff_delay(attempt))
+        data = _loads(response)
+        if response.status >= 300:
+            code = _error_code(response)
+            if isinstance(data, dict):
+                message = data.get('message', data.get('Message', ''))
+            else:
+                # Proxies and load balancers may answer with HTML.
+                message = response.data.decode('utf-8', 'replace')
+            raise ClientError(
+                {
+                    'Error': {'Code': code, 'Message': message},
+                    'ResponseMetadata': {
+                        'HTTPStatusCode': response.status,
+                    },
+                },
+                'SendEmail'
+            )
+        if data is None:
+            raise ClientError(
+                {
+                    'Error': {
+                        'Code': 'InvalidResponse',
+                        'Message': 'Response body is not valid JSON',
+                    },
+                    'ResponseMetadata': {
+                        'HTTPStatusCode': response.status,
+                    },
+                },
+                'SendEmail'
+            )
+        return data
@@ -2,17 +2,22 @@
 Flask extension for sending emails via AWS SES v2 (SESV2).
 """
 
+import mimetypes
 import os
+import weakref
+from functools import cached_property
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from pathlib import Path
 import logging
 
-import boto3
 from botocore.exceptions import ClientError
 
 from aldera import config as aldera_config
+from aldera.config import PLEN, PREFIX
+from aldera._aws import _resolve_region, get_client
+from aldera.mail._mime import attachment_part
+from aldera.utils.ratelimit import bucket_from_config
 
 
 logger = logging.getLogger(__name__)
@@ -56,7 +61,8 @@ class Message:
         Args:
             filename (str): Name of the file
             content_type (str): MIME type (e.g., 'application/pdf')
-            data (bytes): File content as bytes
+            data (bytes or pathlib.Path): File content as bytes, or the
+                path of a file to read when the message is sent
         """
         self.attachments.append((filename, content_type, data))
 
@@ -64,19 +70,17 @@ class Message:
         """
         Attach a file from filesystem.
 
+        Only the path is stored; the file is read and encoded when the
+        message is sent.
+
         Args:
             filepath (str): Path to the file
         """
-        import os
-        import mimetypes
-
         filename = os.path.basename(filepath)
         content_type, _ = mimetypes.guess_type(filepath)
         if content_type is None:
             content_type = 'application/octet-stream'
-        with open(filepath, 'rb') as f:
-            data = f.read()
-        self.attach(filename, content_type, data)
+        self.attach(filename, content_type, Path(filepath))
 
 
 class AlderaEmail:
@@ -107,9 +111,15 @@ class AlderaEmail:
             return 'Email sent!'
     """
 
+    # Live instances, whose cached values are dropped whenever the
+    # Aldera configuration changes, whether through init_app() or a
+    # direct write to the registry. Held weakly so that discarded
+    # instances can be collected.
+    _instances = weakref.WeakSet()
+
     def __init__(self, app=None):
         self.app = app
-        self._client = None
+        AlderaEmail._instances.add(self)
         if app is not None:
             self.init_app(app)
 
@@ -118,28 +128,54 @@ class AlderaEmail:
         Initialize the extension with a Flask app.
         """
         aldera_keys = {
-            key.replace('ALDERA_', ''): app.config[key]
-            for key in app.config
-            if key.startswith('ALDERA_')
+            key[PLEN:]: value
+            for key, value in app.config.items()
+            if key.startswith(PREFIX)
         }
-        aldera_config.load_dict(**aldera_keys)
-        aldera_config.set(DEBUG=getattr(app.config, 'DEBUG', False))
+        aldera_keys['DEBUG'] = app.config.get('DEBUG', False)
+        aldera_config.load_dict(aldera_keys)
         app.extensions = getattr(app, 'extensions', {})
         app.extensions['aldera_email'] = self
 
-    @property
+    def _clear_cache(self):
+        """
+        Forget the values derived from the Aldera configuration.
+        """
+        self.__dict__.pop('client', None)
+        self.__dict__.pop('_config_set_entry', None)
+        self.__dict__.pop('_bucket', None)
+
+    @classmethod
+    def _clear_caches(cls):
+        """
+        Forget the cached values of every live instance.
+        """
+        for instance in list(cls._instances):
+            instance._clear_cache()
+
+    @cached_property
     def client(self):
         """
         Lazy initialization of boto3 SESv2 client.
         """
-        if self._client is None:
-            region = (
-                aldera_config.get('AWS_REGION')
-                or os.environ.get('AWS_REGION')
-                or 'us-east-1'
-            )
-            self._client = boto3.client('sesv2', region_name=region)
-        return self._client
+        return get_client('sesv2', _resolve_region())
+
+    @cached_property
+    def _bucket(self):
+        """
+        Rate limiter keeping sends under the SES quota, or None if
+        SES_RATE is set to None.
+        """
+        return bucket_from_config('SES', 14, 50)
+
+    @cached_property
+    def _config_set_entry(self):
+        """
+        The ConfigurationSetName parameter, or an empty dict if no
+        configuration set is configured.
+        """
+        config_set = aldera_config.get('CONFIGURATION_SET', None)
+        return {'ConfigurationSetName': config_set} if config_set else {}
 
     def send(self, message):
         """
@@ -168,32 +204,21 @@ class AlderaEmail:
         else:
             return self._send_simple(message)
 
+    def _build_body(self, message):
+        """
+        Build the Simple content Body from the text and HTML parts.
+        """
+        charset = message.charset
+        return {
+            part: {'Data': data, 'Charset': charset}
+            for part, data in (('Text', message.body), ('Html', message.html))
+            if data
+        }
+
     def _send_simple(self, message):
         """
         Send a simple email without attachments.
         """
-        # Build email content
-        email_content = {
-            'Simple': {
-                'Subject': {
-                    'Data': message.subject,
-                    'Charset': message.charset
-                },
-                'Body': {}
-            }
-        }
-        # Add text body
-        if message.body:
-            email_content['Simple']['Body']['Text'] = {
-                'Data': message.body,
-                'Charset': message.charset
-            }
-        # Add HTML body
-        if message.html:
-            email_content['Simple']['Body']['Html'] = {
-                'Data': message.html,
-                'Charset': message.charset
-            }
         # Build destination
         destination = {
             'ToAddresses': message.recipients
@@ -204,26 +229,35 @@ class AlderaEmail:
             destination['BccAddresses'] = message.bcc
         # Build request parameters
         params = {
+            **self._config_set_entry,
             'FromEmailAddress': message.sender,
             'Destination': destination,
-            'Content': email_content
+            'Content': {
+                'Simple': {
+                    'Subject': {
+                        'Data': message.subject,
+                        'Charset': message.charset
+                    },
+                    'Body': self._build_body(message),
+                }
+            }
         }
-        # Add configuration set if specified
-        config_set = aldera_config.get('CONFIGURATION_SET', None)
-        if config_set:
-            params['ConfigurationSetName'] = config_set
         # Add reply-to if specified
         if message.reply_to:
             params['ReplyToAddresses'] = message.reply_to
+        if self._bucket is not None:
+            self._bucket.acquire()
         try:
             response = self.client.send_email(**params)
             logger.info(
-                f"Email sent successfully. MessageId: {response['MessageId']}"
+                "Email sent successfully. MessageId: %s",
+                response['MessageId']
             )
             return response
         except ClientError as e:
             logger.error(
-                f"Failed to send email: {e.response['Error']['Message']}"
+                "Failed to send email: %s",
+                e.response['Error']['Message']
             )
             raise
 
@@ -248,14 +282,7 @@ class AlderaEmail:
             msg.attach(MIMEText(message.html, 'html', message.charset))
         # Add attachments
         for filename, content_type, data in message.attachments:
-            part = MIMEBase(*content_type.split('/'))
-            part.set_payload(data)
-            encoders.encode_base64(part)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename="{filename}"'
-            )
-            msg.attach(part)
+            msg.attach(attachment_part(filename, content_type, data))
         # Build destination
         destination = {
             'ToAddresses': message.recipients
@@ -266,6 +293,7 @@ class AlderaEmail:
             destination['BccAddresses'] = message.bcc
         # Build request parameters
         params = {
+            **self._config_set_entry,
             'Content': {
                 'Raw': {
                     'Data': msg.as_bytes()
@@ -273,19 +301,19 @@ class AlderaEmail:
             },
             'Destination': destination
         }
-        # Add configuration set if specified
-        config_set = aldera_config.get('CONFIGURATION_SET', None)
-        if config_set:
-            params['ConfigurationSetName'] = config_set
+        if self._bucket is not None:
+            self._bucket.acquire()
         try:
             response = self.client.send_email(**params)
             logger.info(
-                f"Email sent successfully. MessageId: {response['MessageId']}"
+                "Email sent successfully. MessageId: %s",
+                response['MessageId']
             )
             return response
         except ClientError as e:
             logger.error(
-                f"Failed to send email: {e.response['Error']['Message']}"
+                "Failed to send email: %s",
+                e.response['Error']['Message']
             )
             raise
 
@@ -311,3 +339,6 @@ class AlderaEmail:
             **kwargs
         )
         return self.send(msg)
+
+
+aldera_config.on_change(AlderaEmail._clear_caches)
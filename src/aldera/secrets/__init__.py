@@ -21,53 +21,79 @@ Usage:
     }
 """
 
-import boto3
+import base64
 import json
 import os
+from functools import cached_property
 
-from aldera.config import get as get_config
+from botocore.exceptions import ClientError
+
+from aldera._aws import _resolve_region, get_client
+from aldera.secrets import _cache
 
 
 class Secrets:
 
     def __init__(self):
-        self._settings = None
         # self._source is either 'aws' or 'systemd', indicating where
         # secrets should be retrieved from.
         self._source = os.environ.get('ALDERA_SECRETS_SOURCE')
+        loaders = {
+            'aws': self._get_aws_secrets,
+            'systemd': self._get_systemd_secrets,
+        }
+        self._loader = loaders.get(self._source, self._get_systemd_secrets)
 
-    def _get_aws_secrets(self):
+    def _get_aws_secrets(self, secret_name=None):
         """
         Retrieves secrets from AWS Secrets Manager.
+
+        secret_name defaults to the value of the environment variable
+        ALDERA_SECRETS. If the secret cannot be retrieved, the
+        environment variable of the same name is used instead, and the
+        ClientError is raised if that is not defined either. The secret
+        must be a JSON object. Successful responses are kept in an
+        encrypted on-disk cache when one is configured; see
+        aldera.secrets._cache.
         """
-        region = (
-            get_config('AWS_REGION')
-            or os.environ.get('AWS_REGION')
-            or os.environ.get('AWS_DEFAULT_REGION')
-            or 'us-east-1'
-        )
-        session = boto3.session.Session()
-        client = session.client(
-            service_name='secretsmanager',
-            region_name=region
-        )
-        try:
-            get_secret_value_response = client.get_secret_value(
-                SecretId=secret_name
-            )
-        except ClientError:
-            get_secret_value_response = {
-                'SecretString': os.environ.get(secret_name)
-            }
+        if secret_name is None:
+            secret_name = os.environ.get('ALDERA_SECRETS')
+            if secret_name is None:
+                raise ValueError(''.join([
+                    "Environment variable 'ALDERA_SECRETS' is not defined. ",
+                    'Unable to locate secret.'
+                ]))
+        region = _resolve_region()
+        get_secret_value_response = _cache.read(region, secret_name)
+        if get_secret_value_response is None:
+            client = get_client('secretsmanager', region)
+            try:
+                get_secret_value_response = client.get_secret_value(
+                    SecretId=secret_name
+                )
+            except ClientError:
+                fallback = os.environ.get(secret_name)
+                if fallback is None:
+                    raise
+                get_secret_value_response = {'SecretString': fallback}
+            else:
+                _cache.write(region, secret_name, get_secret_value_response)
 
         if 'SecretString' in get_secret_value_response:
             secret = get_secret_value_response['SecretString']
-            return json.loads(secret) if secret.startswith('{') else secret
         else:
-            decoded_binary_secret = base64.b64decode(
+            secret = base64.b64decode(
                 get_secret_value_response['SecretBinary']
             )
-            return json.loads(decoded_binary_secret)
+        try:
+            secrets = json.loads(secret)
+        except ValueError:
+            secrets = None
+        if not isinstance(secrets, dict):
+            raise ValueError(
+                f"Secret '{secret_name}' does not contain a JSON object."
+            )
+        return secrets
 
     def _get_systemd_secrets(self):
         """
@@ -86,13 +112,18 @@ class Secrets:
         with open(creds_file, 'r') as secrets:
             return json.loads(secrets.read().strip())
 
-    def _settings(self):
-        if self._settings is None:
-            if self._source == 'aws':
-                self._settings = self._get_aws_secrets()
-            else:
-                self._settings = self._get_systemd_secrets()
-        return self._settings
+    def _load(self):
+        """
+        Load secrets from the configured source.
+        """
+        return self._loader()
+
+    @cached_property
+    def settings(self):
+        """
+        Secrets loaded on first access and reused afterwards.
+        """
+        return self._load()
 
 
 def secrets_wrapper():
@@ -100,9 +131,9 @@ def secrets_wrapper():
 
     def get_secret(secret_name):
         """
-        Convenience function for retrieving values from secrets._settings.
+        Convenience function for retrieving values from secrets.settings.
         """
-        return secrets._settings[secret_name]
+        return secrets.settings[secret_name]
 
     return get_secret
 
@@ -0,0 +1,124 @@
+"""
+Defines an encrypted on-disk cache for AWS Secrets Manager responses.
+
+The cache is only used when the optional 'cryptography' package is
+installed and a Fernet key is available, either in the environment
+variable ALDERA_SECRETS_CACHE_KEY or as the systemd credential named
+'aldera-secrets-cache-key'. Cached responses expire after
+ALDERA_SECRETS_CACHE_TTL seconds (default 3600).
+
+Copyright (c) 2025 Zachary Young.
+All rights reserved.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ModuleNotFoundError:
+    Fernet = None
+
+
+DEFAULT_TTL = 3600
+
+
+def _get_key():
+    """
+    Return the Fernet key used to encrypt the cache, or None.
+    """
+    key = os.environ.get('ALDERA_SECRETS_CACHE_KEY')
+    if key:
+        return key
+    creds_dir = os.environ.get('CREDENTIALS_DIRECTORY')
+    if creds_dir:
+        try:
+            with open(
+                os.path.join(creds_dir, 'aldera-secrets-cache-key'),
+                'rb'
+            ) as key_file:
+                return key_file.read().strip() or None
+        except OSError:
+            pass
+    return None
+
+
+def _get_fernet():
+    if Fernet is None:
+        return None
+    key = _get_key()
+    if key is None:
+        return None
+    try:
+        return Fernet(key)
+    except ValueError:
+        return None
+
+
+def _get_path(region, secret_name):
+    cache_home = (
+        os.environ.get('XDG_CACHE_HOME')
+        or os.path.join(os.path.expanduser('~'), '.cache')
+    )
+    digest = hashlib.sha256(
+        f'{region}:{secret_name}'.encode()
+    ).hexdigest()[:16]
+    return os.path.join(cache_home, 'aldera', f'secrets-{digest}.bin')
+
+
+def read(region, secret_name):
+    """
+    Return a cached get_secret_value response, or None on a miss.
+
+    Fernet tokens carry their creation time, so decryption also
+    enforces the TTL.
+    """
+    fernet = _get_fernet()
+    if fernet is None:
+        return None
+    try:
+        with open(_get_path(region, secret_name), 'rb') as cache_file:
+            token = cache_file.read()
+        ttl = int(os.environ.get('ALDERA_SECRETS_CACHE_TTL', DEFAULT_TTL))
+        response = json.loads(fernet.decrypt(token, ttl=ttl))
+    except (OSError, ValueError, InvalidToken):
+        return None
+    if 'SecretBinary' in response:
+        response['SecretBinary'] = base64.b64decode(response['SecretBinary'])
+    return response
+
+
+def write(region, secret_name, response):
+    """
+    Store a get_secret_value response in the cache.
+
+    Failures are ignored; the cache is only an optimization.
+    """
+    fernet = _get_fernet()
+    if fernet is None:
+        return
+    cached = {}
+    if 'SecretString' in response:
+        cached['SecretString'] = response['SecretString']
+    if 'SecretBinary' in response:
+        cached['SecretBinary'] = base64.b64encode(
+            response['SecretBinary']
+        ).decode('ascii')
+    path = _get_path(region, secret_name)
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # Write to a temporary file first so readers never see a
+        # partially written cache entry.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as cache_file:
+                cache_file.write(fernet.encrypt(json.dumps(cached).encode()))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
@@ -5,18 +5,60 @@ Copyright (c) 2025 Zachary Young.
 All rights reserved.
 """
 
-from aldera.config import get as get_config
+import asyncio
+import functools
+import inspect
+
+from aldera.config import get as get_config, on_change
 from aldera.sms import backends
 
 
 DEFAULT_BACKEND = 'locmem'
 
 
+@functools.lru_cache(maxsize=1)
+def _default_backend():
+    return get_config('SMS_BACKEND', DEFAULT_BACKEND)
+
+
+_connections = {}
+
+
+def _cached_connection(backend):
+    try:
+        return _connections[backend]
+    except KeyError:
+        pass
+    klass = backends.backend_classes.get(backend)
+    return _connections.setdefault(backend, klass())
+
+
+def _clear_connections():
+    """
+    Drop the cached backends, closing any that hold open clients.
+    """
+    while _connections:
+        _, connection = _connections.popitem()
+        close = getattr(connection, 'close', None)
+        if close is not None:
+            close()
+
+
+# Configuration changes may select a different backend or region.
+on_change(_default_backend.cache_clear)
+on_change(_clear_connections)
+
+
 def get_connection(backend=None, **kwargs):
     """
     Load an SMS backend and return an instance of it.
+
+    Without keyword arguments, one instance per backend is created and
+    reused until the Aldera configuration changes.
     """
-    _backend = backend or get_config('SMS_BACKEND', DEFAULT_BACKEND)
+    _backend = backend or _default_backend()
+    if not kwargs:
+        return _cached_connection(_backend)
     klass = backends.backend_classes.get(_backend)
     return klass(**kwargs)
 
@@ -55,3 +97,37 @@ async def send_async_message(
     """
     sms = connection or get_connection()
     return await sms.send_message(message, recipient_number)
+
+
+async def send_sms_messages_bulk(messages, connection=None):
+    """
+    Send several messages concurrently.
+
+    Concurrency is bounded by the backend; AsyncSmsBackend allows up to
+    16 publishes in flight at once. Synchronous backends, such as the
+    default locmem backend, send the messages one after another in a
+    worker thread so the event loop is not blocked.
+
+    Args:
+        messages (iterable): (message, recipient_number) pairs
+        connection (connection class or None): the connection object
+            that sends messages
+
+    Returns:
+        list: the result of each send, in the order given
+    """
+    sms = connection or get_connection()
+    if not inspect.iscoroutinefunction(sms.send_message):
+        pairs = list(messages)
+        send_messages = getattr(sms, 'send_messages', None)
+        if send_messages is None:
+            def send_messages(pairs):
+                return [
+                    sms.send_message(message, recipient_number)
+                    for message, recipient_number in pairs
+                ]
+        return list(await asyncio.to_thread(send_messages, pairs))
+    return await asyncio.gather(*(
+        sms.send_message(message, recipient_number)
+        for message, recipient_number in messages
+    ))
@@ -8,12 +8,13 @@ All rights reserved.
 from __future__ import annotations
 
 import asyncio
-import os
+import random
 
 import aioboto3
 import botocore
 
-from aldera.config import get as get_config
+from aldera._aws import _resolve_region
+from aldera.utils.ratelimit import TokenBucket, bucket_from_config
 
 
 class SmsSendError(Exception):
@@ -34,23 +35,33 @@ class AsyncSmsBackend:
         self._max_retries = 3
         self._backoff_base = 0.5
         self._backoff_factor = 2.0
-        self._semaphore = asyncio.Semaphore(2)
+        self._concurrency = 16
+        self._semaphore = None
+        self._bucket = bucket_from_config(
+            'SNS', 20, 20, bucket_class=TokenBucket
+        )
+        self._client = None
+        self._session = None
+        self._closer = None
+        self._loop = None
+        self._client_lock = None
 
     def _get_region(self) -> str:
         """
-        Determines AWS region in order of priority:
-        1. Django ALDERA.AWS_REGION setting
-        2. AWS_REGION environment variable
-        3. AWS_DEFAULT_REGION environment variable
-        4. 'us-east-1'
-        """
-        region = (
-            get_config('AWS_REGION')
-            or os.environ.get('AWS_REGION')
-            or os.environ.get('AWS_DEFAULT_REGION')
-            or 'us-east-1'
+        Returns the AWS region resolved by aldera._aws._resolve_region.
+        """
+        return _resolve_region()
+
+    def _backoff_delay(self, attempt):
+        """
+        Exponential backoff with equal jitter, so that throttled
+        senders do not all retry at the same moment.
+        """
+        return (
+            self._backoff_base
+            * (self._backoff_factor ** (attempt - 1))
+            * (0.5 + random.random())
         )
-        return region
 
     async def _create_sns_client(self):
         """
@@ -66,30 +77,115 @@ class AsyncSmsBackend:
         ).__aenter__()
         return client, session
 
+    async def _client_scope(self, client):
+        """
+        Keep client open until aclose() is called or its event loop
+        shuts down.
+
+        asyncio.run() finalizes async generators before it closes the
+        loop, so the client is closed on its own loop even if the
+        caller never calls aclose().
+        """
+        try:
+            yield
+        finally:
+            await client.__aexit__(None, None, None)
+
+    def _bind_loop(self):
+        """
+        Reset loop-bound state when called from a new event loop.
+
+        The semaphore, the client lock and the client itself are bound
+        to the event loop they are first used on. The backend may be
+        reused across loops (e.g. successive asyncio.run() calls), so
+        each loop gets its own. The previous loop's client is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.close()
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """
+        Return the SNS client, creating it on first use.
+
+        The client is shared by all retries and calls so that publishes
+        reuse one warm connection pool.
+        """
+        self._bind_loop()
+        async with self._client_lock:
+            if self._client is None:
+                self._client, self._session = (
+                    await self._create_sns_client()
+                )
+                self._closer = self._client_scope(self._client)
+                await self._closer.__anext__()
+        return self._client
+
+    def _release_client(self):
+        """
+        Forget the cached client and return the generator that closes
+        it, or None.
+        """
+        closer = self._closer
+        self._client = None
+        self._session = None
+        self._closer = None
+        return closer
+
+    async def aclose(self):
+        """
+        Close the cached SNS client, if one has been created.
+        """
+        closer = self._release_client()
+        if closer is not None:
+            await closer.aclose()
+
+    def close(self):
+        """
+        Close the cached SNS client from synchronous code.
+
+        The client is closed on the event loop it was created on. If
+        that loop has already been shut down by asyncio.run(), the
+        client was closed then.
+        """
+        closer = self._release_client()
+        loop = self._loop
+        if closer is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            loop.create_task(closer.aclose())
+        else:
+            asyncio.run_coroutine_threadsafe(closer.aclose(), loop)
+
     async def send_message(self, message, recipient_number):
         """
         Send an SMS message asynchronously.
         """
         attempt = 0
         last_exception = None
+        self._bind_loop()
         # Acquire semaphore to limit concurrent publishes
         async with self._semaphore:
             while attempt <= self._max_retries:
                 try:
-                    # create client and ensure we close it
-                    session = aioboto3.Session()
-                    async with session.client(
-                        'sns',
-                        region_name=self._get_region()
-                    ) as client:
-                        publish_kwargs = {
-                            'PhoneNumber': recipient_number,
-                            'Message': message,
-                        }
-                        response = await client.publish(**publish_kwargs)
-                        # Success: response typically contains 'MessageId'
-                        message_id = response.get('MessageId')
-                        return message_id
+                    client = await self._get_client()
+                    if self._bucket is not None:
+                        await self._bucket.acquire()
+                    publish_kwargs = {
+                        'PhoneNumber': recipient_number,
+                        'Message': message,
+                    }
+                    response = await client.publish(**publish_kwargs)
+                    # Success: response typically contains 'MessageId'
+                    message_id = response.get('MessageId')
+                    return message_id
                 except botocore.exceptions.ClientError as err:
                     # These are AWS-reported errors (4xx/5xx)
                     # Determine if transient: throttling, service
@@ -118,10 +214,7 @@ class AsyncSmsBackend:
                     attempt += 1
                     if attempt > self._max_retries or not retriable:
                         break
-                    await asyncio.sleep(
-                        self._backoff_base
-                        * (self._backoff_factor ** (attempt - 1))
-                    )
+                    await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 except (
                     botocore.exceptions.EndpointConnectionError,
@@ -132,10 +225,7 @@ class AsyncSmsBackend:
                     attempt += 1
                     if attempt > self._max_retries:
                         break
-                    await asyncio.sleep(
-                        self._backoff_base
-                        * (self._backoff_factor ** (attempt - 1))
-                    )
+                    await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 except Exception as exc:
                     # Unknown error; do not retry
@@ -150,6 +240,11 @@ class AsyncSmsBackend:
         """
         Run the async send_message from synchronous code.
         """
-        return asyncio.run(
-            self.send_message(message, recipient_number)
-        )
+        async def send_and_close():
+            # The client cannot outlive the event loop created here.
+            try:
+                return await self.send_message(message, recipient_number)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(send_and_close())
@@ -5,45 +5,42 @@ Copyright (c) 2025 Zachary Young.
 All rights reserved.
 """
 
-import os
+from functools import cached_property
 
-import boto3
 import botocore
 
+from aldera._aws import _resolve_region, get_client
 from aldera.config import get as get_config
+from aldera.utils.ratelimit import bucket_from_config
 
 
 class SmsBackend:
 
     def __init__(self, *args, **kwargs):
         """
-        Initializes boto3 client.
+        The boto3 client is created on first use; see `client`.
         """
-        self.client = boto3.client(
-            'sns',
-            region_name=self._get_region()
-        )
+        self._bucket = bucket_from_config('SNS', 20, 20)
+
+    @cached_property
+    def client(self):
+        """
+        Lazy initialization of boto3 SNS client.
+        """
+        return get_client('sns', self._get_region())
 
     def _get_region(self):
         """
-        Determines AWS region in order of priority:
-        1. Django ALDERA.AWS_REGION setting
-        2. AWS_REGION environment variable
-        3. AWS_DEFAULT_REGION environment variable
-        4. 'us-east-1'
+        Returns the AWS region resolved by aldera._aws._resolve_region.
         """
-        region = (
-            get_config('AWS_REGION')
-            or os.environ.get('AWS_REGION')
-            or os.environ.get('AWS_DEFAULT_REGION')
-            or 'us-east-1'
-        )
-        return region
+        return _resolve_region()
 
     def send_message(self, message, recipient_number):
         """
         Send message using AWS SNS.
         """
+        if self._bucket is not None:
+            self._bucket.acquire()
         try:
             self.client.publish(
                 PhoneNumber=recipient_number,
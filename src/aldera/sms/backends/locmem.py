@@ -9,8 +9,29 @@ All rights reserved.
 from aldera import sms
 
 
+# Delivered messages are stored in sms.messages.
+if not hasattr(sms, 'messages'):
+    sms.messages = []
+
+
+def _outbox():
+    """
+    Return the current outbox, recreating it if a test deleted it.
+
+    sms.messages is looked up on every call so that tests may reset it
+    by rebinding (sms.messages = []) or deleting it.
+    """
+    try:
+        return sms.messages
+    except AttributeError:
+        sms.messages = []
+        return sms.messages
+
+
 class Message:
 
+    __slots__ = ('message', 'recipient')
+
     def __init__(self, message, recipient_number):
         self.message = message
         self.recipient = recipient_number
@@ -20,14 +41,24 @@ class SmsBackend:
 
     def __init__(self, *args, **kwargs):
         """
-        Stores all delivered SMS messages in a list.
+        Stores all delivered SMS messages in sms.messages.
         """
-        if not hasattr(sms, 'messages'):
-            sms.messages = []
 
     def send_message(self, message, recipient_number):
         """
         Redirect message to mock outbox list.
         """
-        sms.messages.append(Message(message, recipient_number))
+        _outbox().append(Message(message, recipient_number))
         return True
+
+    def send_messages(self, pairs):
+        """
+        Redirect several (message, recipient_number) pairs to the mock
+        outbox list at once.
+        """
+        outgoing = [
+            Message(message, recipient_number)
+            for message, recipient_number in pairs
+        ]
+        _outbox().extend(outgoing)
+        return [True] * len(outgoing)
@@ -7,6 +7,7 @@ All rights reserved.
 """
 
 from aldera import config as aldera_config
+from aldera.config import PLEN, PREFIX
 
 
 class AlderaSMS:
@@ -41,12 +42,12 @@ class AlderaSMS:
         internal configuration registry.
         """
         aldera_keys = {
-            key.replace('ALDERA_', ''): app.config[key]
-            for key in app.config
-            if key.startswith('ALDERA_')
+            key[PLEN:]: value
+            for key, value in app.config.items()
+            if key.startswith(PREFIX)
         }
-        aldera_config.load_dict(**aldera_keys)
-        aldera_config.set(DEBUG=getattr(app.config, 'DEBUG', False))
+        aldera_keys['DEBUG'] = app.config.get('DEBUG', False)
+        aldera_config.load_dict(aldera_keys)
         app.extensions = getattr(app, 'extensions', {})
         app.extensions['aldera_sms'] = self
 
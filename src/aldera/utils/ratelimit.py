@@ -0,0 +1,122 @@
+"""
+Defines token-bucket rate limiters used to stay within AWS SES and SNS
+sending quotas.
+
+Copyright (c) 2025 Zachary Young.
+All rights reserved.
+"""
+
+import asyncio
+import threading
+import time
+
+from aldera import config as aldera_config
+
+
+class _Bucket:
+    """
+    Holds up to `burst` tokens, refilled continuously at `rate` tokens
+    per second.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._updated = time.monotonic()
+
+    def _pieces(self, n):
+        """
+        Split n into amounts of at most burst tokens, so that acquiring
+        more than burst tokens waits for every one of them.
+        """
+        while n > 0:
+            piece = min(n, self.burst)
+            yield piece
+            n -= piece
+
+    def _take(self, n):
+        """
+        Take n tokens if available and return 0, otherwise return the
+        number of seconds until they will be. n must not exceed burst.
+        """
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst,
+            self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        if self.tokens >= n:
+            self.tokens -= n
+            return 0
+        return (n - self.tokens) / self.rate
+
+
+class TokenBucket(_Bucket):
+    """
+    Token bucket for use from a single event loop.
+    """
+
+    async def acquire(self, n=1):
+        """
+        Wait until n tokens are available and take them.
+        """
+        for piece in self._pieces(n):
+            while True:
+                delay = self._take(piece)
+                if not delay:
+                    break
+                await asyncio.sleep(delay)
+
+
+class BlockingTokenBucket(_Bucket):
+    """
+    Thread-safe token bucket for synchronous code.
+    """
+
+    def __init__(self, rate, burst):
+        super().__init__(rate, burst)
+        self._lock = threading.Lock()
+
+    def acquire(self, n=1):
+        """
+        Block until n tokens are available and take them.
+        """
+        for piece in self._pieces(n):
+            while True:
+                with self._lock:
+                    delay = self._take(piece)
+                if not delay:
+                    break
+                time.sleep(delay)
+
+
+def bucket_from_config(
+    prefix,
+    default_rate,
+    default_burst,
+    config=None,
+    bucket_class=BlockingTokenBucket
+):
+    """
+    Build the rate limiter configured by the <prefix>_RATE and
+    <prefix>_BURST settings, or return None if <prefix>_RATE is None.
+
+    Proactively staying under the AWS sending quota avoids retrying on
+    Throttling errors.
+
+    Args:
+        prefix (str): Setting name prefix, e.g. 'SES' or 'SNS'
+        default_rate (float): Sends per second if the rate is not set
+        default_burst (int): Burst size if the burst is not set
+        config (mapping or None): Settings to read; defaults to the
+            Aldera configuration registry
+        bucket_class (callable): Called with (rate, burst) to build
+            the bucket
+    """
+    if config is None:
+        config = aldera_config.settings
+    rate = config.get(f'{prefix}_RATE', default_rate)
+    if not rate:
+        return None
+    return bucket_class(rate, config.get(f'{prefix}_BURST', default_burst))